@@ -4,6 +4,65 @@ from random import randint
 from .connect4_globals import COLUMN_COUNT, ROW_COUNT, SUCCESS, FAILURE, \
                               INF, N_INF
 
+def mirror_column(column):
+    """
+    Maps a column to its mirror image under horizontal reflection.
+
+    Parameters
+    ----------
+    column : int
+        Column on the board.
+
+    Returns
+    -------
+    int
+        Returns the column on the opposite side of the board.
+    """
+    return COLUMN_COUNT - 1 - column
+
+def canonical_position(board):
+    """
+    Maps a board to a canonical key shared with its mirror image.
+
+    Connect4 is symmetric left to right, so a board and its reflection have
+    the same value. The key is the smaller of the two as tuples, so both
+    boards land on the same cache entry.
+
+    Parameters
+    ----------
+    board : list of list of int
+        A board laid out as Game.board, column by column.
+
+    Returns
+    -------
+    tuple
+        Returns (key, mirrored) where key is hashable and mirrored is True
+        if the key was taken from the reflected board.
+    """
+    key = tuple(tuple(column) for column in board)
+    mirrored_key = key[::-1]
+    if mirrored_key < key:
+        return mirrored_key, True
+    return key, False
+
+def canonical_column(column, mirrored):
+    """
+    Remaps a column between a board and its canonical position.
+
+    Parameters
+    ----------
+    column : int
+        Column on the board or on the canonical position.
+    mirrored : bool
+        Flag returned by canonical_position for the board.
+
+    Returns
+    -------
+    int
+        Returns the corresponding column on the other side of the mapping.
+    """
+    return mirror_column(column) if mirrored else column
+
 class Game:
     """
     A class used to represent a game of Connect4.
@@ -251,23 +310,50 @@ class Tree:
         A representation of the state of connect4.
     state : int
         An int representing state of game.
+    cache : dict
+        Evaluations shared across the tree, keyed by canonical position.
 
     Methods
     -------
+    evaluate()
+        Returns the state of the game, using the cache.
     build_tree(ply)
         Builds tree of possible moves of height ply.
     """
-    def __init__(self, ply, game, column=-1):
+    def __init__(self, ply, game, column=-1, cache=None):
         self.game = game
         self.ply = ply
         self.column = column
+        self.cache = {} if cache is None else cache
         self.children = [] if ply == 0 else self.build_tree(ply)
-        self.state = game.count_winning_positions()
+        self.state = self.evaluate()
+
+    def evaluate(self):
+        """
+        Returns the state of the game, reusing the result for any board
+        already seen in this tree or its mirror image.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        int
+            Returns int representing state of game.
+        """
+        key = canonical_position(self.game.board)[0]
+        if key not in self.cache:
+            self.cache[key] = self.game.count_winning_positions()
+        return self.cache[key]
 
     def build_tree(self, ply):
         """
         Builds tree of possible moves of height ply from game.
 
+        On a symmetric board only columns up to the middle are expanded,
+        since the others lead to mirror images of the same positions.
+
         Parameters
         ----------
         ply : int
@@ -279,11 +365,14 @@ class Tree:
             Returns a list of tree of possible moves.
         """
         res = []
-        for i in range(COLUMN_COUNT):
+        columns = range(COLUMN_COUNT)
+        if self.game.board == self.game.board[::-1]:
+            columns = range((COLUMN_COUNT + 1) // 2)
+        for i in columns:
             temp = copy.deepcopy(self.game)
             if temp.valid_move(i):
                 temp.update_board(i)
-                res.append(Tree(ply-1, temp, i))
+                res.append(Tree(ply-1, temp, i, self.cache))
         return res
 
 class Strategy: